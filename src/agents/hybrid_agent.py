@@ -5,21 +5,99 @@ This implementation shows how to use both local tools (executed directly)
 and remote tools (accessed via MCP servers) in the same agent.
 """
 
-import aisuite as ai
 import asyncio
+import httpx
 import json
 import os
+import threading
+import time
 from dotenv import load_dotenv
 from datetime import datetime
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from typing import Dict, List, Any, Optional
+from types import SimpleNamespace
+from typing import Dict, List, Any, Callable, Optional
 import inspect
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 # Load environment variables from .env file
 load_dotenv()
 
+# numba is optional - only needed for JIT-compiled local tools
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# orjson is optional but several times faster than stdlib json on the
+# per-tool-call (de)serialization paths
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj, sort_keys: bool = False) -> str:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=str, option=option).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj, sort_keys: bool = False) -> str:
+        return json.dumps(obj, default=str, sort_keys=sort_keys)
+
+# Python annotation -> JSON schema type for local tool parameters
+_PY_TO_JSON = {int: "integer", float: "number", bool: "boolean", str: "string"}
+
+# Tool-result content larger than this is truncated when trimming history
+_MAX_TOOL_CONTENT_CHARS = 2048
+
+# Default TTL for tools declared cacheable at MCP server registration
+_DEFAULT_CACHE_TTL = 60.0
+
+# Result-cache size bound: once reached, expired entries are purged and
+# the oldest evicted, so long-running sessions can't grow it unbounded
+_RESULT_CACHE_MAX = 256
+
+
+def cacheable(ttl: float = _DEFAULT_CACHE_TTL):
+    """
+    Mark a local tool as idempotent so its results may be cached.
+
+    Args:
+        ttl: How long (seconds) a cached result stays valid
+
+    Returns:
+        Decorator that tags the function with the TTL
+    """
+    def decorator(func):
+        func._cache_ttl = ttl
+        return func
+    return decorator
+
+
+def local_tool(jit: bool = False, cache: bool = True):
+    """
+    Decorator for local tools, optionally JIT-compiling numeric ones.
+
+    Args:
+        jit: Compile the function with numba.njit. Worthwhile for numeric
+            tools invoked many times per session; ignored when numba is
+            not installed.
+        cache: Persist compiled machine code on disk so the compile cost
+            is paid once per machine instead of once per process
+
+    Returns:
+        Decorator returning the (possibly compiled) function
+    """
+    def decorator(func):
+        if jit and njit is not None:
+            return njit(cache=cache)(func)
+        return func
+    return decorator
+
+
 # ==================== LOCAL TOOLS (AISuite) ====================
 
 def get_current_time() -> str:
@@ -30,6 +108,7 @@ def get_current_time() -> str:
     return datetime.now().strftime("%H:%M:%S")
 
 
+@cacheable()
 def calculate_sum(a: float, b: float) -> float:
     """
     Calculate the sum of two numbers.
@@ -44,6 +123,7 @@ def calculate_sum(a: float, b: float) -> float:
     return a + b
 
 
+@cacheable()
 def create_greeting(name: str, formal: bool = False) -> str:
     """
     Create a personalized greeting.
@@ -62,24 +142,106 @@ def create_greeting(name: str, formal: bool = False) -> str:
 
 # ==================== MCP TOOLS CONNECTOR ====================
 
+# Retry/backoff settings for MCP tool calls
+_MAX_TOOL_RETRIES = 3
+_RETRY_BASE_DELAY = 0.1  # seconds, doubled per attempt
+
+
+class CircuitBreaker:
+    """
+    Per-server failure isolation with closed/open/half-open states.
+
+    After failure_threshold consecutive failures the breaker opens and
+    calls fail fast. Once reset_timeout has passed, one probe call is
+    allowed through (half-open); success closes the breaker again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.state = "closed"
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may proceed right now"""
+        if self.state == "open":
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                return True
+            return False
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.state = "closed"
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+
 class MCPConnector:
     """Manages connections to MCP servers and tool execution"""
     
-    def __init__(self):
+    def __init__(self, max_result_chars: int = 65536, call_timeout: float = 10.0):
         self.sessions: Dict[str, ClientSession] = {}
-        self.tools: Dict[str, Dict[str, Any]] = {}  # tool_name -> tool_info
+        self.max_result_chars = max_result_chars  # Cap on stringified tool results
+        self.call_timeout = call_timeout  # Per-attempt timeout for tool calls
+        self.breakers: Dict[str, CircuitBreaker] = {}  # server_name -> breaker
+        self.capabilities: Dict[str, Any] = {}  # server_name -> advertised capabilities
+        # SoA tool storage: parallel lists indexed via _tool_index, so the
+        # hot paths (schema iteration) walk tight lists instead of a
+        # dict of per-tool dicts
+        self._tool_names: List[str] = []
+        self._tool_descs: List[str] = []
+        self._tool_input_schemas: List[dict] = []
+        self._openai_schemas: List[dict] = []
+        self._tool_index: Dict[str, int] = {}  # tool_name -> position
         self.tool_to_server: Dict[str, str] = {}  # tool_name -> server_name
-        self._contexts: Dict[str, Any] = {}  # Store context managers
-    
-    async def add_server(self, server_name: str, command: str, args: List[str]) -> List[str]:
+        self.cacheable_tools: Dict[str, float] = {}  # tool_name -> result cache TTL
+        self._runners: Dict[str, asyncio.Task] = {}  # server_name -> owning task
+        self._shutdown: Dict[str, asyncio.Event] = {}  # server_name -> stop signal
+
+    @staticmethod
+    async def _run_server(server_name: str, params: StdioServerParameters,
+                          ready: asyncio.Future, shutdown: asyncio.Event):
+        """
+        Own one server's transport and session for their whole lifetime.
+
+        anyio cancel scopes must be exited by the task that entered them,
+        so this task enters the stdio transport and session, hands the
+        initialized session back through ready, and holds both open until
+        cleanup() sets the shutdown event. Splitting entry and exit
+        across tasks (as add_mcp_servers' gather children would) makes
+        teardown raise and leaks the server subprocess.
+        """
+        try:
+            async with stdio_client(params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    init_result = await session.initialize()
+                    ready.set_result((session, init_result))
+                    await shutdown.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                print(f"⚠️ {server_name} server connection ended: {e}")
+
+    async def add_server(self, server_name: str, command: str, args: List[str],
+                         cacheable_tools: Optional[List[str]] = None) -> List[str]:
         """
         Connect to an MCP server and fetch its tools.
-        
+
         Args:
             server_name: Name to identify this server
             command: Command to run the server (e.g., "uv")
             args: Arguments for the command (e.g., ["run", "server.py"])
-        
+            cacheable_tools: Names of this server's tools that are
+                idempotent and safe to cache
+
         Returns:
             List of tool names from this server
         """
@@ -87,17 +249,23 @@ class MCPConnector:
 
         server_params = StdioServerParameters(command=command, args=args)
 
-        # Create and store the context manager
-        stdio_context = stdio_client(server_params)
-        read, write = await stdio_context.__aenter__()
+        # Spawn the owning task and wait for it to hand us the session
+        shutdown = asyncio.Event()
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        runner = asyncio.create_task(
+            self._run_server(server_name, server_params, ready, shutdown)
+        )
 
-        # Store the context so we can clean it up later
-        self._contexts[server_name] = stdio_context
+        try:
+            session, init_result = await ready
+        except Exception:
+            shutdown.set()
+            await asyncio.gather(runner, return_exceptions=True)
+            raise
 
-        # Create and initialize session
-        session = ClientSession(read, write)
-        await session.__aenter__()
-        await session.initialize()
+        self._runners[server_name] = runner
+        self._shutdown[server_name] = shutdown
+        self.capabilities[server_name] = getattr(init_result, "capabilities", None)
 
         # Get available tools from the server
         response = await session.list_tools()
@@ -108,15 +276,27 @@ class MCPConnector:
             tool_names.append(tool_name)
 
             # Store tool information
-            self.tools[tool_name] = {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema
-            }
+            self._tool_index[tool_name] = len(self._tool_names)
+            self._tool_names.append(tool.name)
+            self._tool_descs.append(tool.description)
+            self._tool_input_schemas.append(tool.inputSchema)
+            # Convert to OpenAI format once, at registration time
+            self._openai_schemas.append({
+                "type": "function",
+                "function": {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.inputSchema  # MCP calls this input_schema
+                }
+            })
             self.tool_to_server[tool_name] = server_name
 
+        for tool_name in cacheable_tools or []:
+            self.cacheable_tools[tool_name] = _DEFAULT_CACHE_TTL
+
         # Store the session
         self.sessions[server_name] = session
+        self.breakers[server_name] = CircuitBreaker()
 
         print(f"✅ Connected to {server_name} with tools: {tool_names}")
         return tool_names
@@ -139,29 +319,140 @@ class MCPConnector:
         session = self.sessions[server_name]
         
         print(f"🔧 Calling MCP tool: {tool_name} with args: {arguments}")
-        result = await session.call_tool(tool_name, arguments=arguments)
-        
-        # Extract content from the result
+
+        # Timeout + retry with backoff, behind a per-server circuit breaker
+        # so one hung or flapping server can't freeze the agent loop
+        breaker = self.breakers[server_name]
+        for attempt in range(_MAX_TOOL_RETRIES):
+            if not breaker.allow():
+                raise RuntimeError(f"Circuit open for server '{server_name}'; not calling {tool_name}")
+            try:
+                result = await asyncio.wait_for(
+                    session.call_tool(tool_name, arguments=arguments),
+                    timeout=self.call_timeout
+                )
+                breaker.record_success()
+                break
+            except Exception as e:
+                breaker.record_failure()
+                if attempt == _MAX_TOOL_RETRIES - 1:
+                    raise
+                delay = _RETRY_BASE_DELAY * 2 ** attempt
+                print(f"⚠️ {tool_name} failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        return self._result_to_text(result)
+
+    def _result_to_text(self, result: Any) -> str:
+        """Stringify a tool result, capping huge payloads"""
+        # Extract content from the result. The generator feeds join
+        # directly - no intermediate list of quoted reprs
         if hasattr(result, 'content'):
             if isinstance(result.content, list):
-                return str([c.text if hasattr(c, 'text') else str(c) for c in result.content])
-            return str(result.content)
-        return str(result)
+                text = "\n".join(getattr(c, "text", None) or str(c) for c in result.content)
+            else:
+                text = str(result.content)
+        else:
+            text = str(result)
+
+        # Cap huge payloads before they hit the message history
+        if len(text) > self.max_result_chars:
+            text = text[:self.max_result_chars] + f"... [truncated {len(text) - self.max_result_chars} chars]"
+        return text
+
+    async def call_tools(self, calls: List[tuple]) -> List[Any]:
+        """
+        Execute several tool calls, batching per server when supported.
+
+        Calls targeting the same server go out as one batched RPC if the
+        server advertised a batch capability and the session exposes
+        call_tool_batch; otherwise they run concurrently as individual
+        calls. One round trip per server instead of one per call.
+
+        Args:
+            calls: List of (tool_name, arguments) pairs
+
+        Returns:
+            Results aligned with the input order; a failed call yields
+            its exception instead of raising
+        """
+        by_server: Dict[str, List[int]] = {}
+        for i, (tool_name, _) in enumerate(calls):
+            by_server.setdefault(self.tool_to_server.get(tool_name, ""), []).append(i)
+
+        results: List[Any] = [None] * len(calls)
+
+        async def run_server(server_name: str, indices: List[int]):
+            session = self.sessions.get(server_name)
+            batch = getattr(session, "call_tool_batch", None)
+            if batch is not None and len(indices) > 1 and self._supports_batch(server_name):
+                try:
+                    batch_results = await asyncio.wait_for(
+                        batch([{"name": calls[i][0], "arguments": calls[i][1]} for i in indices]),
+                        timeout=self.call_timeout
+                    )
+                    for i, result in zip(indices, batch_results):
+                        results[i] = self._result_to_text(result)
+                    return
+                except Exception:
+                    pass  # Fall back to individual calls below
+
+            individual = await asyncio.gather(
+                *(self.call_tool(calls[i][0], calls[i][1]) for i in indices),
+                return_exceptions=True
+            )
+            for i, result in zip(indices, individual):
+                results[i] = result
+
+        await asyncio.gather(*(run_server(s, idx) for s, idx in by_server.items()))
+        return results
+
+    def _supports_batch(self, server_name: str) -> bool:
+        """Whether a server advertised a batch tool-call capability"""
+        caps = self.capabilities.get(server_name)
+        if isinstance(caps, dict):
+            return bool(caps.get("batch"))
+        return bool(getattr(caps, "batch", None))
     
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
         """Get tool schemas in AISuite format"""
-        return list(self.tools.values())
+        return [
+            {"name": name, "description": desc, "input_schema": schema}
+            for name, desc, schema in zip(self._tool_names, self._tool_descs,
+                                          self._tool_input_schemas)
+        ]
+
+    def get_openai_tool_schemas(self) -> List[Dict[str, Any]]:
+        """Get tool schemas in OpenAI format (converted at registration time)"""
+        return list(self._openai_schemas)
+
+    def iter_openai_schemas(self):
+        """Iterate (tool_name, openai_schema) pairs without building dicts"""
+        return zip(self._tool_names, self._openai_schemas)
+
+    def tool_names(self) -> List[str]:
+        """Names of all registered tools"""
+        return list(self._tool_names)
+
+    def get_tool_info(self, tool_name: str) -> Dict[str, Any]:
+        """Get a single tool's name/description/input schema"""
+        idx = self._tool_index[tool_name]
+        return {
+            "name": self._tool_names[idx],
+            "description": self._tool_descs[idx],
+            "input_schema": self._tool_input_schemas[idx]
+        }
 
     async def cleanup(self):
         """Clean up all connections"""
-        for server_name, session in self.sessions.items():
-            try:
-                await session.__aexit__(None, None, None)
-                context = self._contexts.get(server_name)
-                if context:
-                    await context.__aexit__(None, None, None)
-            except Exception as e:
-                print(f"⚠️ Error cleaning up {server_name}: {e}")
+        # Each owning task exits the contexts it entered
+        for event in self._shutdown.values():
+            event.set()
+        if self._runners:
+            await asyncio.gather(*self._runners.values(), return_exceptions=True)
+        self._runners.clear()
+        self._shutdown.clear()
+        self.sessions.clear()
 
 
 # ==================== HYBRID AGENT ====================
@@ -171,17 +462,91 @@ class HybridAgent:
     Agent that combines local AISuite tools with remote MCP tools.
     """
     
-    def __init__(self):
-        self.ai_client = ai.Client()
-        self.openai_client = OpenAI()  # For MCP tool support with OpenAI
+    def __init__(self, lazy_mcp_schemas: bool = False):
+        """
+        Args:
+            lazy_mcp_schemas: If True, MCP tools are advertised to the LLM
+                with one-line summaries instead of full input schemas.
+                The full schema is sent only after the LLM fetches it via
+                the auto-registered get_tool_schema tool (or after the
+                tool has been called once). Cuts prompt tokens when many
+                MCP servers are connected.
+        """
+        self._ai_client = None  # AISuite client, created lazily on demand
+        # Single shared HTTP pool: keeps connections warm across requests
+        # instead of paying a TLS handshake per client
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30,
+        )
+        self.openai_client = AsyncOpenAI(http_client=self._http)  # For MCP tool support with OpenAI
         self.mcp = MCPConnector()
         self.local_tools = []
+        self.local_tool_schemas: List[dict] = []
         self.local_tool_map = {}
+        self._schema_cache: Optional[List[Dict[str, Any]]] = None
+        # (tool_name, canonical_args_json) -> (monotonic timestamp, result)
+        self._result_cache: Dict[tuple, tuple] = {}
+        self.lazy_mcp_schemas = lazy_mcp_schemas
+        self._hydrated_tools: set = set()  # MCP tools exposed with full schemas
+
+        if lazy_mcp_schemas:
+            def get_tool_schema(server: str, name: str) -> str:
+                """
+                Get the full JSON input schema for an MCP tool.
+
+                Args:
+                    server: Name of the MCP server providing the tool
+                    name: Name of the tool
+
+                Returns:
+                    The tool's input schema as a JSON string
+                """
+                return self._hydrate_tool_schema(server, name)
+
+            self.add_local_tool(get_tool_schema)
+
+    @property
+    def ai_client(self):
+        """
+        AISuite client, created on first access.
+
+        process_query talks to OpenAI directly, so the heavy AISuite
+        provider SDKs are only imported and initialized if a caller
+        actually uses this client.
+        """
+        if self._ai_client is None:
+            import aisuite as ai
+            self._ai_client = ai.Client()
+        return self._ai_client
 
     async def __aenter__(self):
         """Enter async context - agent is ready to use"""
+        await self.warmup()
         return self
 
+    async def warmup(self, ping_llm: bool = False, model: str = "gpt-4o-mini"):
+        """
+        Pre-warm connections so the first query doesn't pay cold-start costs.
+
+        Refreshes every connected MCP session with a cheap list_tools
+        round trip, and optionally primes the OpenAI HTTP connection
+        (TLS handshake, keep-alive) with a one-token request.
+
+        Args:
+            ping_llm: Also send a minimal LLM request (costs one token)
+            model: Model to use for the LLM ping
+        """
+        tasks = [session.list_tools() for session in self.mcp.sessions.values()]
+        if ping_llm:
+            tasks.append(self.openai_client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1
+            ))
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context - cleanup all MCP connections"""
         await self.cleanup()
@@ -194,63 +559,119 @@ class HybridAgent:
         Args:
             func: Python function with proper docstring
         """
+        # JIT-compiled tools carry the original function as py_func;
+        # use it for name/docstring/signature introspection
+        py_func = getattr(func, "py_func", None)
+        tool_name = (py_func or func).__name__
+
         self.local_tools.append(func)
-        self.local_tool_map[func.__name__] = func
-        print(f"✅ Added local tool: {func.__name__}")
+        # Compute the OpenAI schema once at registration time so the
+        # inspect-based conversion stays off the query hot path
+        self.local_tool_schemas.append(self._function_to_schema(py_func or func))
+        self.local_tool_map[tool_name] = func
+        self._schema_cache = None  # Invalidate cached schemas
+
+        if py_func is not None:
+            self._warm_jit(func, py_func)
+
+        print(f"✅ Added local tool: {tool_name}")
     
-    async def add_mcp_server(self, server_name: str, command: str, args: List[str]):
+    @staticmethod
+    def _warm_jit(func, py_func):
+        """
+        Trigger numba compilation at registration time.
+
+        Calls the compiled tool once with zero-valued dummy arguments
+        matching its annotations, so the first real query doesn't pay
+        the JIT compile latency.
+        """
+        try:
+            sig = inspect.signature(py_func)
+            dummy_args = {
+                name: (param.annotation() if param.annotation != inspect.Parameter.empty else 0.0)
+                for name, param in sig.parameters.items()
+            }
+            func(**dummy_args)
+        except Exception:
+            pass  # Compilation happens lazily on first call instead
+
+    async def add_mcp_server(self, server_name: str, command: str, args: List[str],
+                             cacheable_tools: Optional[List[str]] = None):
         """
         Connect to an MCP server.
-        
+
         Args:
             server_name: Name to identify the server
             command: Command to run (e.g., "uv", "python")
             args: Command arguments (e.g., ["run", "server.py"])
+            cacheable_tools: Names of this server's tools whose results
+                may be cached (idempotent tools only)
         """
-        await self.mcp.add_server(server_name, command, args)
+        await self.mcp.add_server(server_name, command, args, cacheable_tools=cacheable_tools)
+        self._schema_cache = None  # Invalidate cached schemas
+
+    async def add_mcp_servers(self, servers: List[tuple]) -> Dict[str, List[str]]:
+        """
+        Connect to several MCP servers in parallel.
+
+        Startup cost is dominated by per-server handshakes, so connecting
+        concurrently makes cold start scale with the slowest server
+        instead of the sum of all of them.
+
+        Args:
+            servers: List of (server_name, command, args) tuples
+
+        Returns:
+            Mapping of server name to its tool names; servers that
+            failed to connect are omitted
+        """
+        results = await asyncio.gather(
+            *(self.mcp.add_server(name, command, args) for name, command, args in servers),
+            return_exceptions=True
+        )
+
+        connected = {}
+        for (name, _, _), result in zip(servers, results):
+            if isinstance(result, Exception):
+                print(f"❌ Failed to connect to {name}: {result}")
+            else:
+                connected[name] = result
+
+        self._schema_cache = None  # Invalidate cached schemas once for the batch
+        return connected
     
-    async def process_query(self, query: str, model: str = "openai:gpt-4o-mini", 
-                          max_turns: int = 5) -> str:
+    async def process_query(self, query: str, model: str = "openai:gpt-4o-mini",
+                          max_turns: int = 5,
+                          on_token: Optional[Callable[[str], None]] = None) -> str:
         """
         Process a user query using both local and remote tools.
-        
+
         Args:
             query: User's question or request
             model: LLM model to use
             max_turns: Maximum number of tool-calling turns
-        
+            on_token: Optional callback invoked with each streamed text
+                token as it arrives, for progressive display
+
         Returns:
             Final response from the agent
         """
         print(f"\n💭 Processing query: {query}\n")
 
-        # Build combined tool schemas for OpenAI API
-        tool_schemas = []
-
-        # Convert local tools to OpenAI tool schema format
-        for func in self.local_tools:
-            schema = self._function_to_schema(func)
-            tool_schemas.append(schema)
-
-        # Convert MCP tool schemas to OpenAI format
-        mcp_tool_schemas = self.mcp.get_tool_schemas()
-        for mcp_schema in mcp_tool_schemas:
-            openai_schema = self._mcp_to_openai_schema(mcp_schema)
-            tool_schemas.append(openai_schema)
-
         messages = [{"role": "user", "content": query}]
 
         for turn in range(max_turns):
             print(f"📍 Turn {turn + 1}/{max_turns}")
 
-            # Use OpenAI API directly to support both local and MCP tools
-            response = self.openai_client.chat.completions.create(
-                model=model.replace("openai:", "") if model.startswith("openai:") else model,
-                messages=messages,
-                tools=tool_schemas if tool_schemas else None
-            )
+            # Combined tool schemas for OpenAI API. Cached, so refetching
+            # each turn only costs anything when a tool was hydrated
+            tool_schemas = self._get_tool_schemas()
 
-            message = response.choices[0].message
+            # Use OpenAI API directly to support both local and MCP tools.
+            # Streaming shortens perceived latency: final-answer tokens are
+            # forwarded to the caller as they arrive instead of after the
+            # full response is buffered.
+            message = await self._stream_completion(model, messages, tool_schemas, on_token)
 
             # Check if we're done (no tool calls)
             if not message.tool_calls:
@@ -276,33 +697,251 @@ class HybridAgent:
                 ]
             })
 
-            # Execute each tool call
+            # Dispatch all tool calls concurrently - they are independent,
+            # so per-turn latency is max(call) instead of sum(calls)
+            local_tasks = []
+            local_dispatched = []  # (tool_call, cache_key) per local task
+            mcp_calls = []  # (tool_call, cache_key, tool_name, tool_args)
+            results_by_id = {}  # tool_call.id -> result (cache hits land here early)
             for tool_call in message.tool_calls:
                 tool_name = tool_call.function.name
-                tool_args = json.loads(tool_call.function.arguments)
+                tool_args = _json_loads(tool_call.function.arguments)
 
                 print(f"  🔧 Tool call: {tool_name}({tool_args})")
 
+                # Serve idempotent tools from the result cache when fresh
+                ttl = self._cache_ttl(tool_name)
+                cache_key = None
+                if ttl is not None:
+                    cache_key = (tool_name, _json_dumps(tool_args, sort_keys=True))
+                    hit = self._result_cache.get(cache_key)
+                    if hit is not None and time.monotonic() - hit[0] < ttl:
+                        print(f"  ⚡ Cached result: {hit[1]}")
+                        results_by_id[tool_call.id] = hit[1]
+                        continue
+
                 # Determine if local or remote tool
                 if tool_name in self.local_tool_map:
-                    # Execute local tool
-                    result = self.local_tool_map[tool_name](**tool_args)
-                    print(f"  ✅ Local tool result: {result}")
+                    # Run sync local tool in a thread so it doesn't block the loop
+                    local_tasks.append(asyncio.to_thread(self.local_tool_map[tool_name], **tool_args))
+                    local_dispatched.append((tool_call, cache_key))
                 else:
-                    # Execute MCP tool
-                    result = await self.mcp.call_tool(tool_name, tool_args)
-                    print(f"  ✅ MCP tool result: {result}")
+                    # A tool the LLM is actively using gets its full schema
+                    # on subsequent turns
+                    if self.lazy_mcp_schemas and tool_name not in self._hydrated_tools:
+                        self._hydrated_tools.add(tool_name)
+                        self._schema_cache = None
+                    mcp_calls.append((tool_call, cache_key, tool_name, tool_args))
+
+            # Remote calls go through the connector in one shot so calls
+            # sharing a server can be batched; local tasks run alongside
+            mcp_future = None
+            if mcp_calls:
+                mcp_future = asyncio.ensure_future(
+                    self.mcp.call_tools([(name, args) for _, _, name, args in mcp_calls])
+                )
+            local_results = await asyncio.gather(*local_tasks, return_exceptions=True)
+            mcp_results = await mcp_future if mcp_future else []
 
-                # Add tool result to messages (OpenAI format)
+            completed = list(zip(local_dispatched, local_results))
+            completed += [((tc, key), result) for (tc, key, _, _), result in zip(mcp_calls, mcp_results)]
+
+            for (tool_call, cache_key), result in completed:
+                if isinstance(result, Exception):
+                    print(f"  ❌ Tool {tool_call.function.name} failed: {result}")
+                    result = f"Error: {result}"
+                else:
+                    print(f"  ✅ Tool result: {result}")
+                    if cache_key is not None:
+                        self._cache_result(cache_key, result)
+                results_by_id[tool_call.id] = result
+
+            # Append results in original order (OpenAI format)
+            for tool_call in message.tool_calls:
+                content = results_by_id[tool_call.id]
+                if not isinstance(content, str):
+                    # Structured results serialize smaller/faster than repr
+                    content = _json_dumps(content)
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "content": str(result)
+                    "content": content
                 })
 
+            # Keep the prompt bounded so per-turn latency stays flat
+            messages = self._trim_messages(messages)
+
         print("⚠️ Reached maximum turns")
         return "I've reached the maximum number of tool calls. Please try again."
 
+    async def _stream_completion(self, model: str, messages: List[dict],
+                                 tool_schemas: List[dict],
+                                 on_token: Optional[Callable[[str], None]] = None):
+        """
+        Run one streamed chat completion and reassemble the message.
+
+        Text deltas are forwarded to on_token as they arrive; tool-call
+        fragments are accumulated by index until the stream ends. Returns
+        an object with .content and .tool_calls matching the shape of a
+        non-streamed completion message.
+        """
+        stream = await self.openai_client.chat.completions.create(
+            model=model.replace("openai:", "") if model.startswith("openai:") else model,
+            messages=messages,
+            tools=tool_schemas if tool_schemas else None,
+            stream=True
+        )
+
+        content_parts = []
+        pending_calls: Dict[int, dict] = {}  # stream index -> partial tool call
+
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+
+            if delta.content:
+                content_parts.append(delta.content)
+                if on_token:
+                    on_token(delta.content)
+
+            for piece in delta.tool_calls or []:
+                call = pending_calls.setdefault(piece.index, {"id": None, "name": "", "arguments": ""})
+                if piece.id:
+                    call["id"] = piece.id
+                if piece.function:
+                    if piece.function.name:
+                        call["name"] += piece.function.name
+                    if piece.function.arguments:
+                        call["arguments"] += piece.function.arguments
+
+        tool_calls = [
+            SimpleNamespace(
+                id=call["id"],
+                function=SimpleNamespace(name=call["name"], arguments=call["arguments"])
+            )
+            for _, call in sorted(pending_calls.items())
+        ]
+
+        return SimpleNamespace(
+            content="".join(content_parts) if content_parts else None,
+            tool_calls=tool_calls or None
+        )
+
+    def _get_tool_schemas(self) -> List[Dict[str, Any]]:
+        """
+        Get the combined local + MCP tool schemas in OpenAI format.
+
+        The list is rebuilt only when a tool or server has been added
+        since the last call; otherwise the cached copy is returned.
+        """
+        if self._schema_cache is not None:
+            return self._schema_cache
+
+        # Both sides were converted to OpenAI format at registration time,
+        # so this is just list concatenation
+        if self.lazy_mcp_schemas:
+            mcp_schemas = [
+                schema if name in self._hydrated_tools else self._summary_schema(name)
+                for name, schema in self.mcp.iter_openai_schemas()
+            ]
+        else:
+            mcp_schemas = self.mcp.get_openai_tool_schemas()
+        tool_schemas = self.local_tool_schemas + mcp_schemas
+
+        self._schema_cache = tool_schemas
+        return tool_schemas
+
+    def _cache_ttl(self, tool_name: str) -> Optional[float]:
+        """TTL for a tool's cached results, or None if not cacheable"""
+        func = self.local_tool_map.get(tool_name)
+        if func is not None:
+            return getattr(func, "_cache_ttl", None)
+        return self.mcp.cacheable_tools.get(tool_name)
+
+    def _cache_result(self, cache_key: tuple, result: Any):
+        """Store a tool result, keeping the cache bounded"""
+        cache = self._result_cache
+        if len(cache) >= _RESULT_CACHE_MAX:
+            # Drop expired entries first; if everything is still fresh,
+            # evict the oldest insertions (dicts preserve insert order)
+            now = time.monotonic()
+            expired = [
+                key for key, (stored_at, _) in cache.items()
+                if now - stored_at >= (self._cache_ttl(key[0]) or 0)
+            ]
+            for key in expired:
+                del cache[key]
+            while len(cache) >= _RESULT_CACHE_MAX:
+                del cache[next(iter(cache))]
+        cache[cache_key] = (time.monotonic(), result)
+
+    def _trim_messages(self, messages: List[dict], max_tokens: int = 8000) -> List[dict]:
+        """
+        Keep the conversation within a rough token budget between turns.
+
+        Oversized tool results are truncated in place, then the oldest
+        assistant/tool turns are dropped (whole blocks, so no tool
+        message is left without its matching tool_calls) until the
+        estimated prompt size fits. The initial user message and the
+        most recent turn are always kept.
+        """
+        # Truncate oversized tool results first - cheap and keeps structure
+        for msg in messages:
+            content = msg.get("content")
+            if (msg.get("role") == "tool" and isinstance(content, str)
+                    and len(content) > _MAX_TOOL_CONTENT_CHARS):
+                dropped = len(content) - _MAX_TOOL_CONTENT_CHARS
+                msg["content"] = content[:_MAX_TOOL_CONTENT_CHARS] + f"... [truncated {dropped} chars]"
+
+        # Cheap token estimate: ~4 chars per token of serialized message
+        def estimate(msg: dict) -> int:
+            return len(_json_dumps(msg)) // 4
+
+        total = sum(estimate(msg) for msg in messages)
+        if total <= max_tokens:
+            return messages
+
+        # Split into the initial user message plus one block per turn
+        # (an assistant message and its tool results)
+        blocks = [messages[:1]]
+        for msg in messages[1:]:
+            if msg.get("role") == "tool":
+                blocks[-1].append(msg)
+            else:
+                blocks.append([msg])
+
+        # Drop oldest turns until we fit, keeping the most recent one
+        while len(blocks) > 2 and total > max_tokens:
+            total -= sum(estimate(msg) for msg in blocks.pop(1))
+
+        return [msg for block in blocks for msg in block]
+
+    def _summary_schema(self, tool_name: str) -> dict:
+        """Build the compact tier-1 schema for an unhydrated MCP tool"""
+        info = self.mcp.get_tool_info(tool_name)
+        server = self.mcp.tool_to_server[tool_name]
+        description = (info["description"] or "").strip().split("\n")[0]
+        return {
+            "type": "function",
+            "function": {
+                "name": tool_name,
+                "description": (
+                    f"[{server}] {description} "
+                    f"Call get_tool_schema('{server}', '{tool_name}') for the parameter schema."
+                ),
+                "parameters": {"type": "object", "properties": {}}
+            }
+        }
+
+    def _hydrate_tool_schema(self, server: str, name: str) -> str:
+        """Return a tool's full input schema and expose it on later turns"""
+        if self.mcp.tool_to_server.get(name) != server:
+            raise ValueError(f"Unknown tool: {name} on server {server}")
+        self._hydrated_tools.add(name)
+        self._schema_cache = None  # Next turn sends the full schema
+        return _json_dumps(self.mcp.get_tool_info(name)["input_schema"])
+
     def _function_to_schema(self, func) -> dict:
         """Convert a Python function to OpenAI tool schema format"""
         sig = inspect.signature(func)
@@ -313,17 +952,7 @@ class HybridAgent:
             # Get type annotation
             param_type = param.annotation if param.annotation != inspect.Parameter.empty else str
 
-            # Convert Python type to JSON schema type
-            if param_type == int:
-                json_type = "integer"
-            elif param_type == float:
-                json_type = "number"
-            elif param_type == bool:
-                json_type = "boolean"
-            else:
-                json_type = "string"
-
-            properties[param_name] = {"type": json_type}
+            properties[param_name] = {"type": _PY_TO_JSON.get(param_type, "string")}
 
             # Check if required (no default value)
             if param.default == inspect.Parameter.empty:
@@ -342,17 +971,6 @@ class HybridAgent:
             }
         }
 
-    def _mcp_to_openai_schema(self, mcp_schema: dict) -> dict:
-        """Convert MCP tool schema to OpenAI format"""
-        return {
-            "type": "function",
-            "function": {
-                "name": mcp_schema["name"],
-                "description": mcp_schema["description"],
-                "parameters": mcp_schema["input_schema"]  # MCP uses input_schema, OpenAI uses parameters
-            }
-        }
-    
     async def chat_loop(self, model: str = "openai:gpt-4o-mini"):
         """
         Run an interactive chat loop.
@@ -364,18 +982,20 @@ class HybridAgent:
         print("🤖 Hybrid Agent Started!")
         print("="*60)
         print(f"📊 Local tools: {list(self.local_tool_map.keys())}")
-        print(f"🌐 MCP tools: {list(self.mcp.tools.keys())}")
+        print(f"🌐 MCP tools: {self.mcp.tool_names()}")
         print("\nType 'quit' to exit, 'help' for commands")
         print("="*60 + "\n")
         
         while True:
             try:
-                user_input = input("You: ").strip()
-                
+                # Read input in a thread so the event loop keeps servicing
+                # MCP sessions and background tasks while the user types
+                user_input = (await asyncio.to_thread(input, "You: ")).strip()
+
                 if user_input.lower() == 'quit':
                     print("👋 Goodbye!")
                     break
-                
+
                 if user_input.lower() == 'help':
                     print("\n📚 Available Commands:")
                     print("  • quit - Exit the chat")
@@ -386,7 +1006,7 @@ class HybridAgent:
                 
                 if user_input.lower() == 'tools':
                     print(f"\n🔧 Local tools: {list(self.local_tool_map.keys())}")
-                    print(f"🌐 MCP tools: {list(self.mcp.tools.keys())}\n")
+                    print(f"🌐 MCP tools: {self.mcp.tool_names()}\n")
                     continue
                 
                 if not user_input:
@@ -403,8 +1023,70 @@ class HybridAgent:
                 print(f"\n❌ Error: {str(e)}\n")
 
     async def cleanup(self):
-        """Clean up MCP connections"""
+        """Clean up MCP connections and the shared HTTP pool"""
         await self.mcp.cleanup()
+        await self._http.aclose()
+
+
+# ==================== SYNC WRAPPER ====================
+
+class AsyncLoopThread:
+    """
+    Owns a long-lived event loop running in a background thread.
+
+    Synchronous callers (threads, web framework workers) can submit
+    coroutines to the shared loop instead of paying for a new event
+    loop per call via asyncio.run. Multiple agents submitted to the
+    same loop run their MCP/LLM I/O concurrently.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Schedule a coroutine on the loop and return a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro):
+        """Run a coroutine on the loop and block until it completes"""
+        return self.submit(coro).result()
+
+    def stop(self):
+        """Stop the loop and join the background thread"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+class HybridAgentSyncWrapper:
+    """
+    Synchronous facade over HybridAgent for non-async hosts.
+
+    All wrapped agents sharing one AsyncLoopThread run on the same
+    event loop, so their I/O overlaps even when callers are plain
+    threads.
+    """
+
+    def __init__(self, agent: "HybridAgent", loop_thread: Optional[AsyncLoopThread] = None):
+        self._agent = agent
+        self._loop_thread = loop_thread or AsyncLoopThread()
+
+    def add_local_tool(self, func):
+        self._agent.add_local_tool(func)
+
+    def add_mcp_server(self, server_name: str, command: str, args: List[str]):
+        return self._loop_thread.run(self._agent.add_mcp_server(server_name, command, args))
+
+    def process_query(self, query: str, **kwargs) -> str:
+        return self._loop_thread.run(self._agent.process_query(query, **kwargs))
+
+    def cleanup(self):
+        self._loop_thread.run(self._agent.cleanup())
 
 
 # ==================== EXAMPLE USAGE ====================
@@ -7,13 +7,83 @@ where all tools are exposed via MCP servers and accessed through a unified clien
 
 import asyncio
 import anthropic
+import hashlib
+import json
+import logging
+import os
+from collections import deque
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+# uvloop is a drop-in asyncio loop replacement that cuts scheduler
+# overhead on I/O-heavy workloads like this agent's stdio + HTTP traffic
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson is optional but several times faster than stdlib json for the
+# serialization this module does (fingerprints, tool-catalog cache)
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj, sort_keys: bool = False) -> str:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=str, option=option).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj, sort_keys: bool = False) -> str:
+        return json.dumps(obj, default=str, sort_keys=sort_keys)
+
 # ==================== SERVER MANAGER ====================
 
+# On-disk cache of discovered tool catalogs, keyed per server config
+_CATALOG_CACHE_PATH = os.path.expanduser("~/.cache/agent-kit/tool_catalog.json")
+
+# Hot-path diagnostics go through logging so they cost nothing above
+# their level and arguments are only formatted when actually emitted
+logger = logging.getLogger(__name__)
+
+# Virtual tool letting the model dispatch several independent tool
+# calls in one turn - executed locally, never sent to a server. Saves a
+# full model round trip (and re-serialized history) per grouped call
+BATCH_EXECUTE_TOOL = "batch_execute"
+_BATCH_EXECUTE_SCHEMA = {
+    "name": BATCH_EXECUTE_TOOL,
+    "description": (
+        "Execute multiple independent tool calls in parallel and return "
+        "their results in order. Prefer this over separate turns when "
+        "several tools can run at once."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "ops": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {"type": "string"},
+                        "arguments": {"type": "object"}
+                    },
+                    "required": ["tool"]
+                }
+            },
+            "max_concurrent": {"type": "integer", "default": 8}
+        },
+        "required": ["ops"]
+    }
+}
+
+
 @dataclass
 class ServerConfig:
     """Configuration for an MCP server"""
@@ -23,65 +93,129 @@ class ServerConfig:
     description: str = ""
 
 
+@dataclass(slots=True)
+class ToolSchema:
+    """Schema of a single MCP tool"""
+    name: str
+    description: str
+    input_schema: dict
+
+
 class ServerManager:
     """Manages multiple MCP server connections"""
     
     def __init__(self):
         self.sessions: Dict[str, ClientSession] = {}
-        self.tools: Dict[str, Any] = {}  # tool_name -> tool_schema
+        self.tools: Dict[str, ToolSchema] = {}  # tool_name -> tool schema
         self.tool_to_server: Dict[str, str] = {}  # tool_name -> server_name
         self.servers: Dict[str, ServerConfig] = {}
-    
+        self.server_to_tools: Dict[str, List[str]] = {}  # server_name -> tool names
+        self._locks: Dict[str, asyncio.Lock] = {}  # server_name -> session lock
+        self._runners: Dict[str, asyncio.Task] = {}  # server_name -> owning task
+        self._shutdown: Dict[str, asyncio.Event] = {}  # server_name -> stop signal
+        self._tools_cache: List[Dict[str, Any]] = []  # Claude-format payloads
+
+    @staticmethod
+    async def _run_server(name: str, params: StdioServerParameters,
+                          ready: asyncio.Future, shutdown: asyncio.Event):
+        """
+        Own one server's transport and session for their whole lifetime.
+
+        anyio cancel scopes must be exited by the task that entered them,
+        so this task enters the stdio transport and session, hands the
+        initialized session back through ready, then holds both open
+        until aclose() sets the shutdown event. Entering the contexts
+        from whichever task called connect_server (e.g. a gather child
+        in add_servers) and exiting them from aclose() would split the
+        scopes across tasks and make teardown raise.
+        """
+        try:
+            async with stdio_client(params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await shutdown.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("⚠️ %s server connection ended: %s", name, e)
+
     async def connect_server(self, config: ServerConfig):
         """
         Connect to an MCP server.
-        
+
         Args:
             config: ServerConfig with connection details
         """
-        print(f"🔌 Connecting to {config.name} server...")
-        print(f"   Command: {config.command} {' '.join(config.args)}")
-        
+        logger.info("🔌 Connecting to %s server...", config.name)
+        logger.info("   Command: %s %s", config.command, " ".join(config.args))
+
         server_params = StdioServerParameters(
             command=config.command,
             args=config.args
         )
-        
+
+        # Spawn the owning task and wait for it to hand us the session
+        shutdown = asyncio.Event()
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        runner = asyncio.create_task(
+            self._run_server(config.name, server_params, ready, shutdown)
+        )
+
         try:
-            # Create streams
-            async with stdio_client(server_params) as (read, write):
-                session = ClientSession(read, write)
-                await session.__aenter__()
-                
-                # Initialize connection
-                await session.initialize()
-                
-                # Get available tools
+            session = await ready
+
+            # Static servers' tool catalogs only change when their source
+            # does (the cache key covers command, args and script mtimes),
+            # so check the on-disk cache before paying the list_tools RTT
+            cache_key = self._catalog_key(config)
+            cached = self._load_catalog().get(cache_key)
+            if cached is not None:
+                tool_infos = cached["tools"]
+            else:
                 response = await session.list_tools()
-                
-                # Store tools
-                tool_names = []
-                for tool in response.tools:
-                    tool_name = tool.name
-                    tool_names.append(tool_name)
-                    
-                    self.tools[tool_name] = {
+                tool_infos = [
+                    {
                         "name": tool.name,
                         "description": tool.description,
                         "input_schema": tool.inputSchema
                     }
-                    self.tool_to_server[tool_name] = config.name
-                
-                # Store session and config
-                self.sessions[config.name] = session
-                self.servers[config.name] = config
-                
-                print(f"✅ Connected to {config.name}")
-                print(f"   Tools: {', '.join(tool_names)}")
-                return tool_names
-                
+                    for tool in response.tools
+                ]
+                self._store_catalog(cache_key, tool_infos)
+
+            # Store tools; the Claude payload list is extended here so
+            # get_all_tools never rebuilds anything
+            tool_names = []
+            for tool_info in tool_infos:
+                tool_name = tool_info["name"]
+                tool_names.append(tool_name)
+                self.tools[tool_name] = ToolSchema(
+                    name=tool_name,
+                    description=tool_info["description"],
+                    input_schema=tool_info["input_schema"]
+                )
+                self._tools_cache.append(tool_info)
+                self.tool_to_server[tool_name] = config.name
+
+            # Store session and config
+            self.sessions[config.name] = session
+            self.servers[config.name] = config
+            self.server_to_tools[config.name] = tool_names
+            self._locks[config.name] = asyncio.Lock()
+            self._runners[config.name] = runner
+            self._shutdown[config.name] = shutdown
+
+            logger.info("✅ Connected to %s", config.name)
+            logger.info("   Tools: %s", ", ".join(tool_names))
+            return tool_names
+
         except Exception as e:
-            print(f"❌ Failed to connect to {config.name}: {str(e)}")
+            logger.error("❌ Failed to connect to %s: %s", config.name, e)
+            # Let the owning task tear down whatever it managed to open
+            shutdown.set()
+            await asyncio.gather(runner, return_exceptions=True)
             raise
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
@@ -104,26 +238,112 @@ class ServerManager:
         if not session:
             raise RuntimeError(f"Not connected to server: {server_name}")
         
-        print(f"  🔧 Calling {tool_name} on {server_name} server")
-        result = await session.call_tool(tool_name, arguments=arguments)
+        logger.debug("  🔧 Calling %s on %s server", tool_name, server_name)
+        # A single stdio session can't interleave requests, so calls to
+        # the same server are serialized; different servers run freely
+        async with self._locks[server_name]:
+            result = await session.call_tool(tool_name, arguments=arguments)
         return result
     
+    @staticmethod
+    def _catalog_key(config: ServerConfig) -> str:
+        """Cache key covering the server command, args and script mtimes"""
+        mtimes = tuple(
+            os.path.getmtime(arg) for arg in config.args if os.path.isfile(arg)
+        )
+        raw = repr((config.command, tuple(config.args), mtimes))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @staticmethod
+    def _load_catalog() -> dict:
+        """Load the on-disk tool catalog cache (best effort)"""
+        try:
+            with open(_CATALOG_CACHE_PATH, "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _store_catalog(cache_key: str, tools: List[dict]):
+        """Write a server's discovered tools to the catalog cache (best effort)"""
+        catalog = ServerManager._load_catalog()
+        catalog[cache_key] = {"tools": tools}
+        try:
+            os.makedirs(os.path.dirname(_CATALOG_CACHE_PATH), exist_ok=True)
+            with open(_CATALOG_CACHE_PATH, "w") as f:
+                f.write(_json_dumps(catalog))
+        except OSError:
+            pass  # Discovery falls back to list_tools next run
+
+    async def aclose(self):
+        """Shut down all sessions and their stdio transports"""
+        # Each owning task exits the contexts it entered
+        for event in self._shutdown.values():
+            event.set()
+        if self._runners:
+            await asyncio.gather(*self._runners.values(), return_exceptions=True)
+        self._runners.clear()
+        self._shutdown.clear()
+        self.sessions.clear()
+        self._locks.clear()
+
+    async def batch_execute(self, ops: List[Dict[str, Any]], max_concurrent: int = 8) -> List[Any]:
+        """
+        Run several tool calls concurrently on behalf of the model.
+
+        Args:
+            ops: List of {"tool": name, "arguments": {...}} entries
+            max_concurrent: Bound on simultaneously running calls
+
+        Returns:
+            Results aligned with ops order; failed calls yield their
+            exception instead of raising
+        """
+        # max_concurrent comes straight from model-controlled tool input:
+        # 0 or a negative value would build a semaphore that can never be
+        # acquired and hang every op, so clamp it to a sane range
+        semaphore = asyncio.Semaphore(max(1, min(int(max_concurrent), 32)))
+
+        async def run(op: Dict[str, Any]):
+            async with semaphore:
+                return await self.call_tool(op["tool"], op.get("arguments", {}))
+
+        return await asyncio.gather(*(run(op) for op in ops), return_exceptions=True)
+
     def get_all_tools(self) -> List[Dict[str, Any]]:
         """Get all tools from all servers in Claude-compatible format"""
-        return list(self.tools.values())
+        if not self._tools_cache:
+            return self._tools_cache
+        # Per-tool payload dicts are prebuilt at connect time; only the
+        # batch_execute virtual tool is appended here
+        return self._tools_cache + [_BATCH_EXECUTE_SCHEMA]
     
     def get_server_info(self) -> Dict[str, List[str]]:
         """Get information about connected servers and their tools"""
-        info = {}
-        for tool_name, server_name in self.tool_to_server.items():
-            if server_name not in info:
-                info[server_name] = []
-            info[server_name].append(tool_name)
-        return info
+        # Maintained incrementally in connect_server - no rescan needed
+        return dict(self.server_to_tools)
 
 
 # ==================== MULTI-SERVER AGENT ====================
 
+# Guard rails for the tool-use loop: hard turn cap, plus how many recent
+# turns' tool-call fingerprints to compare for repetition
+MAX_TURNS = 16
+_SEEN_CALLS_WINDOW = 6
+
+
+def _result_to_str(result: Any) -> str:
+    """Stringify an MCP tool result's content"""
+    # The generator feeds join directly, skipping the intermediate list
+    if hasattr(result, 'content'):
+        if isinstance(result.content, list):
+            return '\n'.join(
+                getattr(c, 'text', None) or str(c)
+                for c in result.content
+            )
+        return str(result.content)
+    return str(result)
+
 class MultiServerAgent:
     """
     Agent that uses tools from multiple MCP servers.
@@ -131,10 +351,25 @@ class MultiServerAgent:
     """
     
     def __init__(self, api_key: Optional[str] = None):
-        self.anthropic = anthropic.Anthropic(api_key=api_key) if api_key else anthropic.Anthropic()
+        # Async client so the event loop stays responsive (tool dispatch,
+        # stdio reads, chat input) during multi-second model round-trips
+        self.anthropic = anthropic.AsyncAnthropic(api_key=api_key) if api_key else anthropic.AsyncAnthropic()
         self.server_manager = ServerManager()
         self.conversation_history = []
-    
+
+    async def __aenter__(self):
+        """Enter async context - agent is ready to use"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit async context - cleanup all MCP connections"""
+        await self.cleanup()
+        return False
+
+    async def cleanup(self):
+        """Clean up MCP connections"""
+        await self.server_manager.aclose()
+
     async def add_server(self, config: ServerConfig):
         """
         Add an MCP server to the agent.
@@ -143,7 +378,90 @@ class MultiServerAgent:
             config: ServerConfig with connection details
         """
         await self.server_manager.connect_server(config)
-    
+
+    async def add_servers(self, configs: List[ServerConfig]) -> Dict[str, List[str]]:
+        """
+        Connect to several MCP servers in parallel.
+
+        Subprocess spawn, initialize and tool discovery for each server
+        overlap, so cold start costs roughly the slowest server instead
+        of the sum of all of them.
+
+        Args:
+            configs: ServerConfigs to connect
+
+        Returns:
+            Mapping of server name to its tool names; servers that
+            failed to connect are logged and omitted
+        """
+        results = await asyncio.gather(
+            *(self.server_manager.connect_server(config) for config in configs),
+            return_exceptions=True
+        )
+
+        connected = {}
+        for config, result in zip(configs, results):
+            if isinstance(result, Exception):
+                logger.warning("❌ Could not connect to %s: %s", config.name, result)
+            else:
+                connected[config.name] = result
+        return connected
+
+    async def _stream_response(self, model: str, max_tokens: int,
+                               messages: List[dict], tools: Optional[List[dict]] = None):
+        """
+        Stream one model response, dispatching tool calls eagerly.
+
+        Each tool_use block starts executing the moment its content
+        block finishes streaming - while the model is still generating
+        the rest of the response - so tool latency hides under
+        generation latency instead of adding to it.
+
+        Returns:
+            (final_message, tasks) where tasks maps tool_use block ids
+            to the already-running asyncio.Tasks executing them
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        kwargs: Dict[str, Any] = {"model": model, "max_tokens": max_tokens, "messages": messages}
+        if tools:
+            kwargs["tools"] = tools
+
+        async with self.anthropic.messages.stream(**kwargs) as stream:
+            async for event in stream:
+                if event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                    block = event.content_block
+                    logger.debug("  🔧 Tool requested: %s", block.name)
+                    logger.debug("     Arguments: %s", block.input)
+                    tasks[block.id] = asyncio.create_task(self._dispatch_tool(block))
+            final_message = await stream.get_final_message()
+
+        return final_message, tasks
+
+    async def _dispatch_tool(self, tool_use) -> str:
+        """
+        Run one tool_use block and return its stringified result.
+
+        The batch_execute virtual tool is expanded here: its ops fan out
+        through ServerManager.batch_execute and come back as one indexed
+        result block, so the model gets N results for one turn.
+        """
+        if tool_use.name == BATCH_EXECUTE_TOOL:
+            args = tool_use.input or {}
+            results = await self.server_manager.batch_execute(
+                args.get("ops", []),
+                args.get("max_concurrent", 8)
+            )
+            parts = []
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    parts.append(f"[{i}] Error: {result}")
+                else:
+                    parts.append(f"[{i}] {_result_to_str(result)}")
+            return "\n".join(parts)
+
+        result = await self.server_manager.call_tool(tool_use.name, tool_use.input)
+        return _result_to_str(result)
+
     async def process_query(self, query: str, model: str = "claude-3-5-sonnet-20241022",
                           max_tokens: int = 2048) -> str:
         """
@@ -157,7 +475,7 @@ class MultiServerAgent:
         Returns:
             Final response from the agent
         """
-        print(f"\n💭 Processing: {query}\n")
+        logger.info("💭 Processing: %s", query)
         
         # Initialize conversation with the query
         messages = [{"role": "user", "content": query}]
@@ -166,104 +484,121 @@ class MultiServerAgent:
         tools = self.server_manager.get_all_tools()
         
         if not tools:
-            print("⚠️ No tools available. Responding without tools.")
-            response = self.anthropic.messages.create(
+            logger.warning("⚠️ No tools available. Responding without tools.")
+            response = await self.anthropic.messages.create(
                 model=model,
                 max_tokens=max_tokens,
                 messages=messages
             )
             return response.content[0].text
-        
-        # Initial request to Claude
-        response = self.anthropic.messages.create(
-            model=model,
-            max_tokens=max_tokens,
-            messages=messages,
-            tools=tools
-        )
-        
-        # Tool use loop
-        turn = 1
-        while response.stop_reason == "tool_use":
-            print(f"📍 Turn {turn}")
-            
-            # Extract assistant content
-            assistant_content = []
-            tool_uses = []
-            
-            for content in response.content:
-                if content.type == "text":
-                    print(f"  💬 Claude: {content.text}")
-                    assistant_content.append(content)
-                elif content.type == "tool_use":
-                    print(f"  🔧 Tool requested: {content.name}")
-                    print(f"     Arguments: {content.input}")
-                    assistant_content.append(content)
-                    tool_uses.append(content)
-            
-            # Add assistant message
-            messages.append({"role": "assistant", "content": assistant_content})
-            
-            # Execute all tool calls
-            tool_results = []
-            for tool_use in tool_uses:
-                try:
-                    # Call the tool via MCP
-                    result = await self.server_manager.call_tool(
-                        tool_use.name,
-                        tool_use.input
-                    )
-                    
-                    # Extract content from result
-                    if hasattr(result, 'content'):
-                        if isinstance(result.content, list):
-                            content_str = '\n'.join([
-                                c.text if hasattr(c, 'text') else str(c) 
-                                for c in result.content
-                            ])
-                        else:
-                            content_str = str(result.content)
-                    else:
-                        content_str = str(result)
-                    
-                    print(f"  ✅ Result: {content_str[:100]}...")
-                    
+
+        # Mark the end of the tools block for Anthropic prompt caching:
+        # the server then reuses the tokenized tools prefix across the
+        # tool-use turns below instead of re-processing it every call.
+        # Copy the last entry so the ServerManager cache isn't mutated
+        tools = tools[:-1] + [{**tools[-1], "cache_control": {"type": "ephemeral"}}]
+
+        tool_tasks: Dict[str, asyncio.Task] = {}
+        try:
+            # Initial request to Claude (streamed, so tool calls can start
+            # before the full response has arrived)
+            response, tool_tasks = await self._stream_response(model, max_tokens, messages, tools)
+
+            # Tool use loop
+            turn = 1
+            seen_calls: deque = deque(maxlen=_SEEN_CALLS_WINDOW)
+            while response.stop_reason == "tool_use":
+                logger.debug("📍 Turn %d", turn)
+
+                # Extract assistant content
+                assistant_content = []
+                tool_uses = []
+
+                for content in response.content:
+                    if content.type == "text":
+                        logger.debug("  💬 Claude: %s", content.text)
+                        assistant_content.append(content)
+                    elif content.type == "tool_use":
+                        # Already logged (and dispatched) while streaming
+                        assistant_content.append(content)
+                        tool_uses.append(content)
+
+                # Abort runaway loops: a misbehaving model can re-issue the
+                # same failing calls forever, growing the prompt every turn
+                fingerprint = hashlib.blake2b(
+                    _json_dumps([(t.name, t.input) for t in tool_uses], sort_keys=True).encode(),
+                    digest_size=8
+                ).hexdigest()
+                if turn > MAX_TURNS or fingerprint in seen_calls:
+                    logger.warning("⚠️ Detected repeated tool calls or too many turns; aborting loop")
+                    # The aborted response usually holds only tool_use
+                    # blocks, so falling through would hand the caller an
+                    # empty string; the finally cancels the running tasks
+                    return ("Aborted: repeated tool calls or too many turns "
+                            "detected; stopping before the loop runs away.")
+                seen_calls.append(fingerprint)
+
+                # Add assistant message
+                messages.append({"role": "assistant", "content": assistant_content})
+
+                # Execute all tool calls concurrently - independent calls to
+                # different servers overlap, so the turn costs max(latency)
+                # instead of sum(latency)
+                # Tool tasks were started as their blocks streamed in, so by
+                # now some (or all) of them have already finished; pop them
+                # so the finally only sees tasks this turn never consumed
+                results = await asyncio.gather(
+                    *(tool_tasks.pop(tool_use.id) for tool_use in tool_uses),
+                    return_exceptions=True
+                )
+
+                tool_results = []
+                for tool_use, result in zip(tool_uses, results):
+                    if isinstance(result, Exception):
+                        logger.warning("  ❌ Error calling %s: %s", tool_use.name, result)
+                        tool_results.append({
+                            "type": "tool_result",
+                            "tool_use_id": tool_use.id,
+                            "content": f"Error: {str(result)}",
+                            "is_error": True
+                        })
+                        continue
+
+                    content_str = result
+                    logger.debug("  ✅ Result: %.100s...", content_str)
+
                     tool_results.append({
                         "type": "tool_result",
                         "tool_use_id": tool_use.id,
                         "content": content_str
                     })
-                    
-                except Exception as e:
-                    print(f"  ❌ Error calling {tool_use.name}: {str(e)}")
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": f"Error: {str(e)}",
-                        "is_error": True
-                    })
-            
-            # Add tool results
-            messages.append({"role": "user", "content": tool_results})
-            
-            # Get next response
-            response = self.anthropic.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                messages=messages,
-                tools=tools
-            )
-            
-            turn += 1
-        
-        # Extract final response
-        final_response = ""
-        for content in response.content:
-            if content.type == "text":
-                final_response += content.text
-        
-        print(f"\n✨ Final response generated\n")
-        return final_response
+
+                # Add tool results
+                messages.append({"role": "user", "content": tool_results})
+
+                # Get next response
+                response, tool_tasks = await self._stream_response(model, max_tokens, messages, tools)
+
+                turn += 1
+
+            # Extract final response
+            final_response = ""
+            for content in response.content:
+                if content.type == "text":
+                    final_response += content.text
+
+            logger.info("✨ Final response generated")
+            return final_response
+        finally:
+            # Reap tool tasks no turn consumed - loop-guard aborts, tool_use
+            # blocks on a non-tool_use stop reason (e.g. max_tokens
+            # truncation), or an exception above. Cancelling and awaiting
+            # them avoids orphaned side-effecting calls and the
+            # 'exception was never retrieved' warnings
+            if tool_tasks:
+                for task in tool_tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tool_tasks.values(), return_exceptions=True)
     
     async def chat_loop(self, model: str = "claude-3-5-sonnet-20241022"):
         """
@@ -286,7 +621,9 @@ class MultiServerAgent:
         
         while True:
             try:
-                user_input = input("You: ").strip()
+                # Read input in a thread so the event loop keeps servicing
+                # MCP sessions and background tasks while the user types
+                user_input = (await asyncio.to_thread(input, "You: ")).strip()
                 
                 if user_input.lower() == 'quit':
                     print("👋 Goodbye!")
@@ -356,7 +693,9 @@ EXAMPLE_SERVERS = [
 
 async def main():
     """Example usage of the Multi-Server Agent"""
-    
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("\n" + "="*70)
     print("🚀 Initializing Multi-Server MCP Agent")
     print("="*70 + "\n")
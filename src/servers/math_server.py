@@ -3,34 +3,101 @@
 Math Server - Provides mathematical calculation tools
 """
 from mcp.server.fastmcp import FastMCP
+import ast
+import functools
 import math
+import operator
 from typing import List
 
+# numpy is optional - used to vectorize reductions over large inputs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# gmpy2's prime-swing factorial beats math.factorial for large n;
+# fall back to the stdlib implementation when it isn't installed
+try:
+    import gmpy2
+
+    def _factorial(n: int) -> int:
+        return int(gmpy2.fac(n))
+except ImportError:
+    _factorial = math.factorial
+
 mcp = FastMCP("math")
 
+# Below this size, numpy array construction costs more than it saves
+_VECTORIZE_THRESHOLD = 256
+
+# Operators the calculator accepts, mapped to their C implementations
+_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+# Only allow safe mathematical operations
+_ALLOWED_NAMES = {
+    'abs': abs, 'round': round,
+    'min': min, 'max': max,
+    'sum': math.fsum, 'pow': pow,
+    'sqrt': math.sqrt, 'pi': math.pi,
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _parse(expression: str) -> ast.Expression:
+    """Parse an expression once; repeated expressions skip the parser"""
+    return ast.parse(expression, mode="eval")
+
+
+def _eval_node(node):
+    """Evaluate a parsed expression node, rejecting anything unlisted"""
+    if isinstance(node, ast.Expression):
+        return _eval_node(node.body)
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)):
+            return node.value
+        raise ValueError(f"Unsupported constant: {node.value!r}")
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPS:
+        return _OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _OPS:
+        return _OPS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.Name):
+        if node.id in _ALLOWED_NAMES:
+            return _ALLOWED_NAMES[node.id]
+        raise ValueError(f"Unknown name: {node.id}")
+    if isinstance(node, ast.Call):
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported")
+        func = _eval_node(node.func)
+        return func(*[_eval_node(arg) for arg in node.args])
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return [_eval_node(element) for element in node.elts]
+    raise ValueError(f"Unsupported expression: {type(node).__name__}")
+
 
 @mcp.tool()
 def calculate(expression: str) -> float:
     """
     Evaluate a mathematical expression safely.
-    
+
     Args:
         expression: Mathematical expression (e.g., "2 + 2 * 3")
-    
+
     Returns:
         Result of the calculation
     """
-    # Only allow safe mathematical operations
-    allowed_names = {
-        'abs': abs, 'round': round,
-        'min': min, 'max': max,
-        'sum': sum, 'pow': pow,
-        'sqrt': math.sqrt, 'pi': math.pi,
-        'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
-    }
-    
     try:
-        result = eval(expression, {"__builtins__": {}}, allowed_names)
+        result = _eval_node(_parse(expression))
         return float(result)
     except Exception as e:
         return f"Error: {str(e)}"
@@ -79,7 +146,12 @@ def average(numbers: List[float]) -> float:
     """
     if not numbers:
         return 0.0
-    return sum(numbers) / len(numbers)
+    if np is not None and len(numbers) >= _VECTORIZE_THRESHOLD:
+        # SIMD reduction over a float64 array beats per-element
+        # PyObject unboxing once inputs get large
+        return float(np.mean(np.asarray(numbers, dtype=np.float64)))
+    # fsum is exact (no float rounding drift) at the same cost as sum
+    return math.fsum(numbers) / len(numbers)
 
 
 @mcp.tool()
@@ -95,7 +167,7 @@ def factorial(n: int) -> int:
     """
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers")
-    return math.factorial(n)
+    return _factorial(n)
 
 
 if __name__ == "__main__":
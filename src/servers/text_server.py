@@ -5,6 +5,7 @@ Text Server - Provides text manipulation tools
 from mcp.server.fastmcp import FastMCP
 import os
 import json
+from pathlib import Path
 
 mcp = FastMCP("text")
 
@@ -37,7 +38,8 @@ def count_characters(text: str, include_spaces: bool = True) -> int:
     """
     if include_spaces:
         return len(text)
-    return len(text.replace(" ", ""))
+    # Count instead of allocating a space-stripped copy of the text
+    return len(text) - text.count(" ")
 
 
 @mcp.tool()
@@ -81,8 +83,9 @@ def write_file(filename: str, content: str) -> str:
         Success message
     """
     try:
-        with open(filename, 'w') as f:
-            f.write(content)
+        # One open/write/close in binary mode - skips the TextIOWrapper
+        # buffering layers, which dominate cost for short files
+        Path(filename).write_bytes(content.encode("utf-8"))
         return f"Successfully wrote to {filename}"
     except Exception as e:
         return f"Error writing file: {str(e)}"
@@ -100,9 +103,9 @@ def read_file(filename: str) -> str:
         File content or error message
     """
     try:
-        with open(filename, 'r') as f:
-            content = f.read()
-        return content
+        # Single read of the raw bytes plus one decode, instead of the
+        # io module's buffered text machinery
+        return Path(filename).read_bytes().decode("utf-8")
     except Exception as e:
         return f"Error reading file: {str(e)}"
 
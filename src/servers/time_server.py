@@ -5,9 +5,28 @@ Time Server - Provides time and date related tools
 from mcp.server.fastmcp import FastMCP
 from datetime import datetime, timedelta
 from typing import Optional
+import functools
+import re
 
 mcp = FastMCP("time")
 
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD string without the strptime overhead.
+
+    The fixed format lets us slice digits directly, and agents tend to
+    reuse a small set of dates, so parses are memoized.
+    """
+    match = _DATE_RE.match(date)
+    if not match:
+        raise ValueError(f"Invalid date (expected YYYY-MM-DD): {date}")
+    year, month, day = map(int, match.groups())
+    return datetime(year, month, day)
+
 
 @mcp.tool()
 def get_current_time() -> str:
@@ -54,9 +73,8 @@ def add_days(date: str, days: int) -> str:
     Returns:
         New date as string
     """
-    dt = datetime.strptime(date, "%Y-%m-%d")
-    new_dt = dt + timedelta(days=days)
-    return new_dt.strftime("%Y-%m-%d")
+    new_dt = _parse_date(date) + timedelta(days=days)
+    return new_dt.date().isoformat()
 
 
 @mcp.tool()
@@ -71,9 +89,7 @@ def days_between(start_date: str, end_date: str) -> int:
     Returns:
         Number of days between the dates
     """
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    delta = end - start
+    delta = _parse_date(end_date) - _parse_date(start_date)
     return delta.days
 
 